@@ -3,10 +3,15 @@ Enhanced agent example with graph database integration
 """
 
 from langchain_core.messages import HumanMessage
-from langgraph.checkpoint.sqlite import SqliteSaver
+from langchain_core.utils.interactive_env import is_interactive_env
 from langgraph.prebuilt import create_react_agent
 from langchain_openai import ChatOpenAI
 from langchain.tools import tool
+from types import MappingProxyType
+from dataclasses import replace
+import functools
+import sys
+from run_config import EDGES, FEATURES, NODES, LazySqliteSaver, RunConfig
 import os
 
 # Example tools
@@ -20,54 +25,62 @@ def get_weather(city: str) -> str:
     """Get the current weather in a city."""
     return f"The weather in {city} is sunny and 72°F"
 
-# Create the agent
-llm = ChatOpenAI(model="gpt-4o-mini", temperature=0)
-tools = [add_numbers, get_weather]
-agent = create_react_agent(llm, tools)
+# Create the agent lazily so importing this module stays cheap
+@functools.lru_cache(maxsize=1)
+def get_agent():
+    """Build the react agent on first use and reuse it afterwards"""
+    llm = ChatOpenAI(model="gpt-4o-mini", temperature=0)
+    tools = [add_numbers, get_weather]
+    return create_react_agent(llm, tools)
+
+# Static portion of the enhanced configuration, built once at import time.
+# Every level is read-only because all configs share these objects.
+_STATIC_CONFIGURABLE = MappingProxyType({
+    "user_id": "user123",
+    "session_id": "session456",
+    
+    # Graph database configuration
+    "graph_db": MappingProxyType({
+        "type": "sqlite",
+        "path": "./knowledge_graph.db",
+        "schema": MappingProxyType({
+            "nodes": NODES,
+            "edges": EDGES
+        })
+    }),
+    
+    # Memory configuration
+    "memory": MappingProxyType({
+        "type": "sqlite",
+        "table": "conversation_memory",
+        "max_tokens": 4000,
+        "retention_days": 30
+    }),
+    
+    # Custom metadata
+    "metadata": MappingProxyType({
+        "environment": "development",
+        "version": "1.0.0",
+        "features": FEATURES,
+        "graph_queries": MappingProxyType({
+            "find_related": "MATCH (n)-[r]->(m) WHERE n.id = $node_id RETURN m, r",
+            "get_entities": "MATCH (n:entity) RETURN n LIMIT 10"
+        })
+    })
+})
+
+# Checkpointing - shared across all configs, opened only when a config is invoked
+_CHECKPOINT_STORE = LazySqliteSaver("sqlite:///checkpoints.db")
 
 # Enhanced configuration with graph database
-def create_enhanced_config(thread_id: str = "1"):
+def create_enhanced_config(thread_id: str = "1") -> RunConfig:
     """Create an enhanced configuration with graph database support"""
     
-    return {
-        "configurable": {
-            "thread_id": thread_id,
-            "user_id": "user123",
-            "session_id": "session456",
-            
-            # Graph database configuration
-            "graph_db": {
-                "type": "sqlite",
-                "path": "./knowledge_graph.db",
-                "schema": {
-                    "nodes": ["concepts", "entities", "relationships"],
-                    "edges": ["relates_to", "part_of", "similar_to"]
-                }
-            },
-            
-            # Memory configuration
-            "memory": {
-                "type": "sqlite",
-                "table": "conversation_memory",
-                "max_tokens": 4000,
-                "retention_days": 30
-            },
-            
-            # Checkpointing
-            "checkpoint_store": SqliteSaver.from_conn_string("sqlite:///checkpoints.db"),
-            
-            # Custom metadata
-            "metadata": {
-                "environment": "development",
-                "version": "1.0.0",
-                "features": ["graph_db", "memory", "checkpointing"],
-                "graph_queries": {
-                    "find_related": "MATCH (n)-[r]->(m) WHERE n.id = $node_id RETURN m, r",
-                    "get_entities": "MATCH (n:entity) RETURN n LIMIT 10"
-                }
-            }
-        }
-    }
+    return RunConfig(
+        thread_id=thread_id,
+        checkpoint_store=_CHECKPOINT_STORE,
+        **_STATIC_CONFIGURABLE
+    )
 
 # Example usage
 def run_enhanced_agent():
@@ -80,46 +93,48 @@ def run_enhanced_agent():
     messages = [HumanMessage(content="Add 3 and 4, then tell me about the weather in Paris.")]
     
     # Run with enhanced config
-    result = agent.invoke({"messages": messages}, config)
+    result = get_agent().invoke({"messages": messages}, config.as_langgraph_config())
     
     # Print results
     print("Enhanced Agent Result:")
-    for message in result['messages']:
-        message.pretty_print()
+    html = is_interactive_env()
+    sys.stdout.write("\n".join(message.pretty_repr(html=html) for message in result['messages']) + "\n")
     
     return result
 
+# Graph database operations to add to your agent
+_GRAPH_OPERATIONS = MappingProxyType({
+    "store_entity": lambda entity: f"Stored entity: {entity}",
+    "find_relationships": lambda entity: f"Found relationships for: {entity}",
+    "query_graph": lambda query: f"Executed query: {query}"
+})
+
 # Graph database integration example
 def integrate_with_graph_db():
     """Example of how to integrate with a graph database"""
     
     config = create_enhanced_config("graph_conversation")
     
-    # Add graph database operations to your agent
-    graph_operations = {
-        "store_entity": lambda entity: f"Stored entity: {entity}",
-        "find_relationships": lambda entity: f"Found relationships for: {entity}",
-        "query_graph": lambda query: f"Executed query: {query}"
-    }
-    
     # Enhanced config with graph operations
-    config["configurable"]["graph_operations"] = graph_operations
-    
-    return config
+    return replace(config, graph_operations=_GRAPH_OPERATIONS)
 
 if __name__ == "__main__":
     # Example 1: Basic enhanced config
     print("=== Enhanced Configuration Example ===")
     config = create_enhanced_config()
     print("Config structure:")
-    for key, value in config["configurable"].items():
-        print(f"  {key}: {type(value).__name__}")
+    sys.stdout.write("\n".join(
+        f"  {key}: {type(value).__name__}"
+        for key, value in config.as_configurable().items()
+    ) + "\n")
     
     print("\n=== Graph Database Integration ===")
     graph_config = integrate_with_graph_db()
     print("Graph operations available:")
-    for op_name in graph_config["configurable"]["graph_operations"].keys():
-        print(f"  - {op_name}")
+    sys.stdout.write("\n".join(
+        f"  - {op_name}"
+        for op_name in graph_config.graph_operations.keys()
+    ) + "\n")
     
     # Uncomment to run the actual agent
     # result = run_enhanced_agent()
@@ -2,31 +2,49 @@
 Example of extended LangGraph configuration with graph database integration
 """
 
+import copy
 import os
-from typing import Dict, Any, Optional
-from langgraph.checkpoint.sqlite import SqliteSaver
+from typing import Optional
 from langgraph.graph.graph import CompiledGraph
+from run_config import EDGES, FEATURES, NODES, LazySqliteSaver, RunConfig
+
+# Builder fields holding caller-supplied containers, copied on every build
+_CONTAINER_FIELDS = ("graph_db", "memory", "metadata")
+
+# Sentinel for builder fields that have not been set
+_UNSET = object()
 
 class GraphConfigBuilder:
     """Builder class for creating comprehensive LangGraph configurations"""
     
+    __slots__ = (
+        "thread_id",
+        "user_id",
+        "session_id",
+        "graph_db",
+        "memory",
+        "checkpoint_store",
+        "metadata",
+    )
+    
     def __init__(self):
-        self.config = {"configurable": {}}
+        for name in self.__slots__:
+            setattr(self, name, _UNSET)
     
     def add_thread_id(self, thread_id: str) -> 'GraphConfigBuilder':
         """Add thread ID for conversation tracking"""
-        self.config["configurable"]["thread_id"] = thread_id
+        self.thread_id = thread_id
         return self
     
     def add_user_context(self, user_id: str, session_id: str) -> 'GraphConfigBuilder':
         """Add user and session context"""
-        self.config["configurable"]["user_id"] = user_id
-        self.config["configurable"]["session_id"] = session_id
+        self.user_id = user_id
+        self.session_id = session_id
         return self
     
     def add_neo4j_graph(self, uri: str, user: str, password: str, database: str = "neo4j") -> 'GraphConfigBuilder':
         """Add Neo4j graph database configuration"""
-        self.config["configurable"]["graph_db"] = {
+        self.graph_db = {
             "type": "neo4j",
             "uri": uri,
             "user": user,
@@ -37,7 +55,7 @@ class GraphConfigBuilder:
     
     def add_sqlite_graph(self, db_path: str) -> 'GraphConfigBuilder':
         """Add SQLite graph database configuration"""
-        self.config["configurable"]["graph_db"] = {
+        self.graph_db = {
             "type": "sqlite",
             "path": db_path
         }
@@ -45,7 +63,7 @@ class GraphConfigBuilder:
     
     def add_memory_config(self, memory_type: str, **kwargs) -> 'GraphConfigBuilder':
         """Add memory configuration"""
-        self.config["configurable"]["memory"] = {
+        self.memory = {
             "type": memory_type,
             **kwargs
         }
@@ -53,17 +71,21 @@ class GraphConfigBuilder:
     
     def add_checkpointing(self, checkpoint_path: str) -> 'GraphConfigBuilder':
         """Add checkpointing configuration"""
-        self.config["configurable"]["checkpoint_store"] = SqliteSaver.from_conn_string(checkpoint_path)
+        self.checkpoint_store = LazySqliteSaver(checkpoint_path)
         return self
     
     def add_custom_metadata(self, **metadata) -> 'GraphConfigBuilder':
         """Add custom metadata to configuration"""
-        self.config["configurable"]["metadata"] = metadata
+        self.metadata = metadata
         return self
     
-    def build(self) -> Dict[str, Any]:
+    def build(self) -> RunConfig:
         """Build and return the final configuration"""
-        return self.config
+        return RunConfig(**{
+            name: copy.deepcopy(getattr(self, name)) if name in _CONTAINER_FIELDS else getattr(self, name)
+            for name in self.__slots__
+            if getattr(self, name) is not _UNSET
+        })
 
 # Example usage
 def create_advanced_config():
@@ -88,7 +110,7 @@ def create_advanced_config():
               .add_custom_metadata(
                   environment="production",
                   version="1.0.0",
-                  features=["graph_db", "memory", "checkpointing"]
+                  features=FEATURES
               )
               .build())
     
@@ -107,8 +129,8 @@ def create_sqlite_config():
               )
               .add_custom_metadata(
                   graph_schema={
-                      "nodes": ["concepts", "entities", "relationships"],
-                      "edges": ["relates_to", "part_of", "similar_to"]
+                      "nodes": NODES,
+                      "edges": EDGES
                   }
               )
               .build())
@@ -131,4 +153,4 @@ if __name__ == "__main__":
     
     # Example of using the config with your agent
     # messages = [HumanMessage(content="Add 3 and 4.")]
-    # result = react_graph_memory.invoke({"messages": messages}, advanced_config)
+    # result = react_graph_memory.invoke({"messages": messages}, advanced_config.as_langgraph_config())
@@ -0,0 +1,96 @@
+"""
+Shared run configuration and checkpoint helpers for the LangGraph examples
+"""
+
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, Any, Final, Mapping, Optional, Union
+from langgraph.checkpoint.sqlite import SqliteSaver
+
+# Graph schema and feature names shared by the examples
+NODES: Final = ("concepts", "entities", "relationships")
+EDGES: Final = ("relates_to", "part_of", "similar_to")
+FEATURES: Final = ("graph_db", "memory", "checkpointing")
+
+# Shared checkpointers keyed by normalized database path
+_CHECKPOINTER_CACHE: Dict[str, SqliteSaver] = {}
+_CHECKPOINTER_LOCK = threading.Lock()
+
+def _sqlite_path(conn_str: str) -> str:
+    """Strip the sqlite:/// scheme from a connection string"""
+    prefix = "sqlite:///"
+    return conn_str[len(prefix):] if conn_str.startswith(prefix) else conn_str
+
+def _cache_key(path: str) -> str:
+    """Resolve a database path so different spellings of one file share a connection"""
+    return path if path == ":memory:" else os.path.abspath(path)
+
+def get_saver(conn_str: str) -> SqliteSaver:
+    """Return the shared SqliteSaver for a connection string, creating it on first use"""
+    path = _sqlite_path(conn_str)
+    key = _cache_key(path)
+    saver = _CHECKPOINTER_CACHE.get(key)
+    if saver is not None:
+        return saver
+    with _CHECKPOINTER_LOCK:
+        # Re-check so threads that missed together open only one connection
+        saver = _CHECKPOINTER_CACHE.get(key)
+        if saver is None:
+            conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            saver = SqliteSaver(conn)
+            _CHECKPOINTER_CACHE[key] = saver
+    return saver
+
+class LazySqliteSaver:
+    """Defers opening the checkpoint database until the config is invoked"""
+    
+    __slots__ = ("_conn_str", "_saver")
+    
+    def __init__(self, conn_str: str):
+        self._conn_str = conn_str
+        self._saver: Optional[SqliteSaver] = None
+    
+    def resolve(self) -> SqliteSaver:
+        """Return the shared SqliteSaver, opening the connection on first call"""
+        if self._saver is None:
+            self._saver = get_saver(self._conn_str)
+        return self._saver
+    
+    def __repr__(self) -> str:
+        state = "resolved" if self._saver is not None else "unresolved"
+        return f"LazySqliteSaver({self._conn_str!r}, {state})"
+
+@dataclass(frozen=True, slots=True)
+class RunConfig:
+    """Typed run configuration, converted to a dict only at the LangGraph boundary.
+
+    Mapping fields take part in equality but not in the hash, since dicts are unhashable.
+    """
+    thread_id: Optional[str] = None
+    user_id: Optional[str] = None
+    session_id: Optional[str] = None
+    graph_db: Optional[Mapping[str, Any]] = field(default=None, hash=False)
+    memory: Optional[Mapping[str, Any]] = field(default=None, hash=False)
+    checkpoint_store: Optional[Union[SqliteSaver, LazySqliteSaver]] = None
+    metadata: Optional[Mapping[str, Any]] = field(default=None, hash=False)
+    graph_operations: Optional[Mapping[str, Any]] = field(default=None, hash=False)
+
+    def as_configurable(self) -> Dict[str, Any]:
+        """Return the set fields as a dict without touching the checkpoint database"""
+        return {
+            name: getattr(self, name)
+            for name in self.__slots__
+            if getattr(self, name) is not None
+        }
+
+    def as_langgraph_config(self) -> Dict[str, Any]:
+        """Return the config in the {"configurable": {...}} shape LangGraph expects"""
+        configurable = self.as_configurable()
+        store = configurable.get("checkpoint_store")
+        if isinstance(store, LazySqliteSaver):
+            configurable["checkpoint_store"] = store.resolve()
+        return {"configurable": configurable}